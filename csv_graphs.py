@@ -7,52 +7,280 @@ USAGE (examples):
   python3 csv_graphs.py --csv data.csv --sep ';' --decimal ','
   python3 csv_graphs.py --csv data.csv --time-col timestamp --y-cols power_w,current_a
   python3 csv_graphs.py --csv data.csv --save-dir ./plots --no-show
+  python3 csv_graphs.py --csv data.csv --save-dir ./plots --no-show --fmt webp
+  python3 csv_graphs.py --csv big_log.csv --chunksize 100000 --save-dir ./plots --no-show
+  python3 csv_graphs.py --csv energy_log.parquet --columns "Timestamp,Power (W)" --skip-heatmap
 """
 
 import argparse
+import io
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 import pandas as pd
 import numpy as np
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+from PIL import Image
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # optional: multi-threaded CSV parsing, Parquet logs
+    pa = pacsv = pq = None
+
+# Cheaper Agg rendering for long lines: merge sub-pixel segments and stroke
+# paths in chunks (applied by main(), not on import)
+FAST_RC = {"path.simplify_threshold": 1.0, "agg.path.chunksize": 10000}
+
+# Fast encoder settings for the formats maybe_save() writes itself: zlib level 1
+# instead of Pillow's default 6 for PNG, fastest method for (lossy) WebP
+PIL_SAVE_KWARGS = {
+    "png": {"compress_level": 1, "optimize": False},
+    "webp": {"quality": 90, "method": 0},
+}
+
+# Background image writers used by maybe_save()
+_save_pool = None
+_pending_saves = []
 
 # ------------------ Helpers ------------------
 
-def smart_read_csv(path, sep=',', decimal='.', encoding=None):
-    """Read CSV and auto-detect common date columns."""
-    kw = {"sep": sep, "decimal": decimal}
+# Timestamp formats written by the loggers in this repo (main.py, main1.py, main2.py)
+KNOWN_DATE_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S.%f",
+)
+
+# Characters replaced by "_" in saved plot filenames
+UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\-.]")
+
+# Cheap prefilters before trying to parse a column as dates
+DATE_NAME = re.compile(r"(?i)time|date|stamp|(?:^|_)ts$")
+DATE_VALUE = re.compile(r"^\d{2,4}[-/]\d|^\d{1,2}:\d\d")
+
+def looks_like_date(col, sample):
+    """True if the column name or its first few values suggest dates/times."""
+    return bool(DATE_NAME.search(str(col))) or any(DATE_VALUE.match(str(v)) for v in sample[:10])
+
+def guess_date_format(values):
+    """Return the first known format that parses all values, None if only inference works.
+
+    Raises ValueError/TypeError if the values don't look like dates at all.
+    """
+    for fmt in KNOWN_DATE_FORMATS:
+        try:
+            pd.to_datetime(values, errors='raise', format=fmt)
+            return fmt
+        except (ValueError, TypeError):
+            continue
+    pd.to_datetime(values, errors='raise')
+    return None
+
+def is_parquet(path):
+    return Path(path).suffix.lower() == ".parquet"
+
+def read_parquet(path, columns=None):
+    """Read a Parquet log, loading only `columns` (all if None)."""
+    if pq is None:
+        raise ImportError("pyarrow is required to read Parquet files")
+    return pq.read_table(path, columns=columns).to_pandas(self_destruct=True)
+
+def read_chunks(path, chunksize, sep=',', decimal='.', encoding=None, columns=None):
+    """Yield the file as DataFrames of at most `chunksize` rows (CSV or Parquet)."""
+    if is_parquet(path):
+        if pq is None:
+            raise ImportError("pyarrow is required to read Parquet files")
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+        return
+    kw = {"sep": sep, "decimal": decimal, "chunksize": chunksize, "usecols": columns}
     if encoding:
         kw["encoding"] = encoding
-    df = pd.read_csv(path, **kw)
-    # Try to parse likely date/time columns
+    yield from pd.read_csv(path, **kw)
+
+def arrow_read_csv(path, encoding=None, columns=None):
+    """Read a plain comma/dot CSV with PyArrow's parallel reader; None if Arrow can't parse it."""
+    read_options = pacsv.ReadOptions(block_size=8 << 20, use_threads=True, encoding=encoding or "utf8")
+    # ISO8601 covers every timestamp format the loggers write, so date columns
+    # are converted during parsing rather than in a second pass
+    convert_options = pacsv.ConvertOptions(timestamp_parsers=[pacsv.ISO8601], include_columns=columns)
+    try:
+        table = pacsv.read_csv(path, read_options=read_options, convert_options=convert_options)
+    except pa.ArrowInvalid:
+        return None
+    # Match pandas' naming of blank headers
+    names = [c if c else f"Unnamed: {i}" for i, c in enumerate(table.column_names)]
+    if len(set(names)) != len(names):
+        # Duplicate headers: let pandas apply its own 'a', 'a.1' renaming
+        return None
+    df = table.to_pandas(self_destruct=True)
+    df.columns = names
+    return df
+
+def smart_read_csv(path, sep=',', decimal='.', encoding=None, columns=None):
+    """Read CSV (or Parquet) and auto-detect common date columns."""
+    if is_parquet(path):
+        return read_parquet(path, columns=columns)
+    df = None
+    if pacsv is not None and sep == ',' and decimal == '.':
+        df = arrow_read_csv(path, encoding=encoding, columns=columns)
+    if df is None:
+        kw = {"sep": sep, "decimal": decimal, "usecols": columns}
+        if encoding:
+            kw["encoding"] = encoding
+        df = pd.read_csv(path, **kw)
+    # Try to parse likely date/time columns: decide on a small sample of unique
+    # values, then parse the full column once with a fixed format and cache
     for col in df.columns:
-        if df[col].dtype == object:
+        if df[col].dtype.kind == 'O':
+            sample = df[col].dropna().head(500).unique()
+            if not len(sample) or not looks_like_date(col, sample):
+                continue
             try:
-                s = pd.to_datetime(df[col], errors='raise', utc=False)
-                ok_ratio = s.notna().mean() if len(s) else 0
-                if ok_ratio >= 0.8:
-                    df[col] = s
+                fmt = guess_date_format(sample)
             except Exception:
-                pass
+                continue
+            s = pd.to_datetime(df[col], errors='coerce', format=fmt, cache=True)
+            ok_ratio = s.notna().mean() if len(s) else 0
+            if ok_ratio >= 0.8:
+                df[col] = s
     return df
 
+def streamed_stats(path, chunksize, bins=30, sep=',', decimal='.', encoding=None, columns=None):
+    """Stream a CSV/Parquet file in chunks and return (histograms, correlation) for its numeric columns.
+
+    Two passes: the first gathers per-column min/max and the pairwise sums
+    needed for an online Pearson correlation (pairwise-complete rows, like
+    DataFrame.corr), the second fills fixed-edge histograms. Peak memory is
+    one chunk instead of the whole file.
+    """
+    kw = {"sep": sep, "decimal": decimal, "encoding": encoding, "columns": columns}
+
+    cols = None
+    for chunk in read_chunks(path, chunksize, **kw):
+        if cols is None:
+            cols = numeric_cols(chunk)
+            if not cols:
+                raise ValueError("No numeric columns found.")
+            lo = np.full(len(cols), np.inf)
+            hi = np.full(len(cols), -np.inf)
+            # Accumulate around the first chunk's means to avoid cancellation
+            # on large offsets (e.g. epoch timestamps)
+            shift = chunk[cols].mean().fillna(0).to_numpy()
+            # Pairwise sums: [i, j] is taken over rows where both columns are present
+            n = np.zeros((len(cols), len(cols)))
+            sx = np.zeros_like(n)
+            sxx = np.zeros_like(n)
+            sxy = np.zeros_like(n)
+        x = chunk[cols].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+        lo = np.fmin(lo, np.nanmin(x, axis=0, initial=np.inf))
+        hi = np.fmax(hi, np.nanmax(x, axis=0, initial=-np.inf))
+        m = (~np.isnan(x)).astype(np.float64)
+        x = np.where(m > 0, x - shift, 0.0)
+        n += m.T @ m
+        sx += x.T @ m
+        sxx += (x * x).T @ m
+        sxy += x.T @ x
+    if cols is None:
+        raise ValueError("File is empty.")
+
+    edges = {}
+    counts = {}
+    for i, col in enumerate(cols):
+        if np.isfinite(lo[i]):
+            edges[col] = np.linspace(lo[i], hi[i], bins + 1) if hi[i] > lo[i] else np.linspace(lo[i] - 0.5, lo[i] + 0.5, bins + 1)
+            counts[col] = np.zeros(len(edges[col]) - 1, dtype=np.int64)
+    for chunk in read_chunks(path, chunksize, **kw):
+        for col in counts:
+            v = pd.to_numeric(chunk[col], errors='coerce').dropna().to_numpy()
+            counts[col] += np.histogram(v, bins=edges[col])[0]
+    hists = {col: (counts[col], edges[col]) for col in counts}
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = n * sxy - sx * sx.T
+        var = (n * sxx - sx * sx) * (n * sxx.T - sx.T * sx.T)
+        r = np.where(n > 1, cov / np.sqrt(var), np.nan)
+    corr = pd.DataFrame(r, index=cols, columns=cols)
+    return hists, corr
+
 def numeric_cols(df):
     return df.select_dtypes(include=[np.number]).columns.tolist()
 
 def datetime_cols(df):
     return df.select_dtypes(include=["datetime64[ns]", "datetimetz"]).columns.tolist()
 
+def minmax_decimate(x, y, target=4000):
+    """Thin (x, y) to about `target` points, keeping the min and max of each bucket."""
+    n = len(y)
+    if n <= target:
+        return x, y
+    stride = -(-n // (target // 2))
+    buckets = n // stride
+    y2 = y[:stride * buckets].reshape(buckets, stride)
+    idx = np.stack([y2.argmin(axis=1), y2.argmax(axis=1)], axis=1)
+    idx = np.sort(idx, axis=1) + (np.arange(buckets) * stride)[:, None]
+    idx = idx.ravel()
+    # Leftover samples (fewer than one stride) form a last, shorter bucket
+    tail = y[stride * buckets:]
+    if len(tail):
+        idx = np.concatenate([idx, np.sort([tail.argmin(), tail.argmax()]) + stride * buckets])
+    return x[idx], y[idx]
+
 def ensure_dir(p: Path):
     p.mkdir(parents=True, exist_ok=True)
 
-def maybe_save(fig, save_dir: Path, title_stub: str):
+class _RGBACapture(io.BytesIO):
+    """File object for savefig(format='rgba') that keeps the (h, w, 4) pixel array."""
+    rgba = None
+
+    def write(self, data):
+        # Agg hands over its buffer as a 3-D (h, w, 4) memoryview of RGBA pixels
+        self.rgba = np.array(data, dtype=np.uint8)
+        return self.rgba.nbytes
+
+def _write_image(out, rgba, dpi, fmt):
+    # Runs on a worker thread: report failures here, like the plotters' skips,
+    # since nobody may ever look at the future's result
+    try:
+        Image.fromarray(rgba, "RGBA").save(out, dpi=(dpi, dpi), **PIL_SAVE_KWARGS[fmt])
+    except Exception as e:
+        print(f"[maybe_save] skipped: {out}: {e}")
+        return
+    print(f"Saved: {out}")
+
+def wait_for_saves():
+    """Block until queued image writes have finished (failures are already reported)."""
+    while _pending_saves:
+        _pending_saves.pop(0).result()
+
+def maybe_save(fig, save_dir: Path, title_stub: str, dpi=150):
+    global _save_pool
     if save_dir is None:
         return
     ensure_dir(save_dir)
-    safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in title_stub)
-    out = save_dir / f"{safe}.png"
-    fig.savefig(out, bbox_inches="tight", dpi=150)
-    print(f"Saved: {out}")
+    safe = UNSAFE_FILENAME_CHARS.sub("_", title_stub)
+    # Output format follows rcParams["savefig.format"] (set from --fmt)
+    fmt = plt.rcParams["savefig.format"]
+    out = save_dir / f"{safe}.{fmt}"
+    if fmt not in PIL_SAVE_KWARGS:
+        fig.savefig(out, bbox_inches="tight", dpi=dpi)
+        print(f"Saved: {out}")
+        return
+    # Render here (Matplotlib isn't thread-safe), then let a worker thread do
+    # the image encoding and disk write while the next figure is drawn
+    capture = _RGBACapture()
+    fig.savefig(capture, format="rgba", bbox_inches="tight", dpi=dpi)
+    if capture.rgba is None or capture.rgba.ndim != 3:
+        fig.savefig(out, bbox_inches="tight", dpi=dpi, pil_kwargs=PIL_SAVE_KWARGS[fmt])
+        print(f"Saved: {out}")
+        return
+    if _save_pool is None:
+        _save_pool = ThreadPoolExecutor(max_workers=2)
+    _pending_saves.append(_save_pool.submit(_write_image, out, capture.rgba, dpi, fmt))
 
 # ------------------ Plotters ------------------
 
@@ -66,56 +294,95 @@ def line_over_time(df, time_col=None, y_cols=None, title='Line over time', save_
         y_cols = numeric_cols(df)
     if not y_cols:
         raise ValueError("No numeric columns to plot.")
-    for col in y_cols:
-        fig = plt.figure()
-        df.plot(x=time_col, y=col, kind='line', legend=False)
-        plt.title(f"{title}: {col}")
-        plt.xlabel(time_col)
-        plt.ylabel(col)
-        plt.tight_layout()
-        maybe_save(fig, save_dir, f"line_{col}_vs_{time_col}")
-        if show:
-            plt.show()
-        else:
-            plt.close(fig)
+    t = df[time_col].to_numpy()
+    is_date = np.issubdtype(t.dtype, np.datetime64)
+    if is_date:
+        # Convert the shared time axis to Matplotlib date numbers once, not
+        # once per line through the units machinery
+        t = mdates.date2num(t)
+    fig, axes = plt.subplots(len(y_cols), 1, sharex=True, squeeze=False,
+                             figsize=(8, 2 + 1.8 * len(y_cols)))
+    for ax, col in zip(axes[:, 0], y_cols):
+        y = df[col].to_numpy(dtype=float, na_value=np.nan)
+        ok = ~np.isnan(y)
+        ax.plot(*minmax_decimate(t[ok], y[ok]), linewidth=0.5)
+        ax.set_ylabel(col)
+        if is_date:
+            ax.xaxis_date()
+    # x-limits are known up front for numeric/date axes; set them once for all
+    # shared axes (other x types, e.g. string labels, keep autoscaling)
+    finite = t[np.isfinite(t)] if np.issubdtype(t.dtype, np.number) else t[:0]
+    if len(finite) > 1:
+        t0, t1 = finite.min(), finite.max()
+        pad = (t1 - t0) * plt.rcParams["axes.xmargin"]
+        axes[0, 0].set_xlim(t0 - pad, t1 + pad)
+    axes[-1, 0].set_xlabel(time_col)
+    fig.suptitle(title)
+    fig.tight_layout()
+    maybe_save(fig, save_dir, f"line_vs_{time_col}")
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
 
 def bar_top_n(df, by_col, value_col, n=10, ascending=False, title='Top N', save_dir=None, show=True):
     tmp = df[[by_col, value_col]].dropna()
-    agg = tmp.groupby(by_col, dropna=False)[value_col].sum().sort_values(ascending=ascending)
-    top = agg.head(n)
-    fig = plt.figure()
-    top.plot(kind='bar')
-    plt.title(f"{title}: {value_col} by {by_col}")
-    plt.xlabel(by_col)
-    plt.ylabel(value_col)
-    plt.tight_layout()
+    # Group sums via factorize + bincount instead of a pandas groupby
+    codes, uniques = pd.factorize(tmp[by_col].to_numpy())
+    sums = np.bincount(codes, weights=tmp[value_col].to_numpy(dtype=float), minlength=len(uniques))
+    k = min(n, len(sums))
+    if 0 < k < len(sums):
+        idx = np.argpartition(sums if ascending else -sums, k - 1)[:k]
+    else:
+        idx = np.arange(k)
+    top = pd.Series(sums[idx], index=pd.Index(uniques[idx], name=by_col)).sort_values(ascending=ascending)
+    fig, ax = plt.subplots()
+    top.plot(kind='bar', ax=ax)
+    ax.set_title(f"{title}: {value_col} by {by_col}")
+    ax.set_xlabel(by_col)
+    ax.set_ylabel(value_col)
+    fig.tight_layout()
     maybe_save(fig, save_dir, f"bar_top_{n}_{value_col}_by_{by_col}")
     if show:
         plt.show()
     else:
         plt.close(fig)
 
-def histograms(df, bins=30, save_dir=None, show=True):
-    nums = numeric_cols(df)
-    if not nums:
+def histogram_counts(hists, save_dir=None, show=True):
+    """Plot precomputed histograms given as {column: (counts, edges)} on one figure."""
+    if not hists:
         raise ValueError("No numeric columns found for histograms.")
-    for col in nums:
-        fig = plt.figure()
-        df[col].dropna().plot(kind='hist', bins=bins)
-        plt.title(f"Histogram: {col}")
-        plt.xlabel(col)
-        plt.tight_layout()
-        maybe_save(fig, save_dir, f"hist_{col}")
-        if show:
-            plt.show()
-        else:
-            plt.close(fig)
+    ncols = min(3, len(hists))
+    nrows = -(-len(hists) // ncols)
+    fig, axes = plt.subplots(nrows, ncols, squeeze=False, figsize=(4 * ncols, 3 * nrows))
+    for ax, (col, (counts, edges)) in zip(axes.ravel(), hists.items()):
+        ax.stairs(counts, edges, fill=True)
+        ax.set_title(f"Histogram: {col}")
+        ax.set_xlabel(col)
+        ax.set_ylabel("Frequency")
+    for ax in axes.ravel()[len(hists):]:
+        ax.set_visible(False)
+    fig.tight_layout()
+    maybe_save(fig, save_dir, "histograms")
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
+
+def histograms(df, bins=30, save_dir=None, show=True):
+    hists = {}
+    for col in numeric_cols(df):
+        counts, edges = np.histogram(df[col].dropna().to_numpy(), bins=bins)
+        hists[col] = (counts, edges)
+    histogram_counts(hists, save_dir=save_dir, show=show)
 
 def scatter(df, x, y, title=None, save_dir=None, show=True):
-    fig = plt.figure()
-    df.plot(kind='scatter', x=x, y=y)
-    plt.title(title or f"Scatter: {x} vs {y}")
-    plt.tight_layout()
+    fig, ax = plt.subplots()
+    ax.scatter(df[x].to_numpy(), df[y].to_numpy())
+    ax.set_title(title or f"Scatter: {x} vs {y}")
+    ax.set_xlabel(x)
+    ax.set_ylabel(y)
+    fig.tight_layout()
     maybe_save(fig, save_dir, f"scatter_{x}_vs_{y}")
     if show:
         plt.show()
@@ -126,7 +393,22 @@ def correlation_heatmap(df, save_dir=None, show=True):
     num = df[numeric_cols(df)]
     if num.empty or num.shape[1] < 2:
         raise ValueError("Need at least two numeric columns for a correlation heatmap.")
-    corr = num.corr(numeric_only=True)
+    arr = num.to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    if np.isnan(arr).any():
+        # Pairwise NaN handling needs pandas' slower path
+        corr = num.corr(numeric_only=True)
+    else:
+        # Standardize in float64 (columns like epoch timestamps lose everything
+        # in float32 before centering), then one float32 matrix product (sgemm)
+        arr -= arr.mean(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            arr /= arr.std(axis=0)
+        z = np.ascontiguousarray(arr, dtype=np.float32)
+        corr = pd.DataFrame((z.T @ z) / z.shape[0], index=num.columns, columns=num.columns)
+    correlation_matrix(corr, save_dir=save_dir, show=show)
+
+def correlation_matrix(corr, save_dir=None, show=True):
+    """Plot a precomputed correlation matrix (square DataFrame) as a heatmap."""
     fig = plt.figure(figsize=(6,5))
     plt.imshow(corr, interpolation='nearest')
     plt.xticks(range(len(corr.columns)), corr.columns, rotation=90)
@@ -142,9 +424,46 @@ def correlation_heatmap(df, save_dir=None, show=True):
 
 # ------------------ Main ------------------
 
+def run_streamed(csv_path, args, save_dir, show, columns=None):
+    """--chunksize mode: histograms and correlation heatmap without loading the whole CSV."""
+    for flag, name in ((not args.skip_line, "line_over_time"),
+                       (args.scatter_x and args.scatter_y, "scatter"),
+                       (args.top_by and args.top_val, "bar_top_n")):
+        if flag:
+            print(f"[{name}] skipped: not available with --chunksize")
+    if args.skip_hist and args.skip_heatmap:
+        return
+
+    try:
+        hists, corr = streamed_stats(csv_path, args.chunksize, bins=args.bins,
+                                     sep=args.sep, decimal=args.decimal, encoding=args.encoding,
+                                     columns=columns)
+    except Exception as e:
+        for flag, name in ((not args.skip_hist, "histograms"),
+                           (not args.skip_heatmap, "correlation_heatmap")):
+            if flag:
+                print(f"[{name}] skipped: {e}")
+        return
+    print(f"Streamed: {csv_path} | Chunk size: {args.chunksize} | Numeric columns: {len(hists)}")
+
+    if not args.skip_hist:
+        try:
+            histogram_counts(hists, save_dir=save_dir, show=show)
+        except Exception as e:
+            print(f"[histograms] skipped: {e}")
+
+    if not args.skip_heatmap:
+        try:
+            if corr.shape[1] < 2:
+                raise ValueError("Need at least two numeric columns for a correlation heatmap.")
+            correlation_matrix(corr, save_dir=save_dir, show=show)
+        except Exception as e:
+            print(f"[correlation_heatmap] skipped: {e}")
+
 def main():
     ap = argparse.ArgumentParser(description="Generate graphs from a CSV quickly.")
-    ap.add_argument("--csv", required=True, help="Path to CSV file")
+    ap.add_argument("--csv", required=True, help="Path to CSV file (or .parquet log)")
+    ap.add_argument("--columns", default=None, help="Comma-separated columns to load (default all)")
     ap.add_argument("--sep", default=",", help="CSV separator (default ',')")
     ap.add_argument("--decimal", default=".", help="Decimal char (default '.')")
     ap.add_argument("--encoding", default=None, help="CSV encoding (e.g., 'utf-8', 'latin-1')")
@@ -156,11 +475,14 @@ def main():
     ap.add_argument("--bins", type=int, default=30, help="Bins for histograms")
     ap.add_argument("--scatter-x", default=None, help="X column for scatter")
     ap.add_argument("--scatter-y", default=None, help="Y column for scatter")
-    ap.add_argument("--save-dir", default=None, help="Directory to save PNGs (no saving if omitted)")
+    ap.add_argument("--save-dir", default=None, help="Directory to save images (no saving if omitted)")
+    ap.add_argument("--fmt", choices=sorted(PIL_SAVE_KWARGS), default="png", help="Image format for --save-dir (default png)")
     ap.add_argument("--no-show", action="store_true", help="Do not display plots interactively")
     ap.add_argument("--skip-line", action="store_true", help="Skip line-over-time plots")
     ap.add_argument("--skip-hist", action="store_true", help="Skip histograms")
     ap.add_argument("--skip-heatmap", action="store_true", help="Skip correlation heatmap")
+    ap.add_argument("--chunksize", type=int, default=None,
+                    help="Stream the CSV in chunks of N rows (histograms and heatmap only, low memory)")
     args = ap.parse_args()
 
     csv_path = Path(args.csv)
@@ -168,12 +490,21 @@ def main():
         print(f"ERROR: CSV file not found: {csv_path}", file=sys.stderr)
         sys.exit(1)
 
-    df = smart_read_csv(csv_path, sep=args.sep, decimal=args.decimal, encoding=args.encoding)
-    print(f"Loaded: {csv_path} | Rows: {len(df)} | Columns: {len(df.columns)}")
-    print("Columns:", df.columns.tolist())
-
     save_dir = Path(args.save_dir) if args.save_dir else None
     show = not args.no_show
+    plt.rcParams.update(FAST_RC)
+    plt.rcParams["savefig.format"] = args.fmt
+    columns = [s.strip() for s in args.columns.split(",")] if args.columns else None
+
+    if args.chunksize:
+        run_streamed(csv_path, args, save_dir, show, columns=columns)
+        wait_for_saves()
+        return
+
+    df = smart_read_csv(csv_path, sep=args.sep, decimal=args.decimal, encoding=args.encoding,
+                        columns=columns)
+    print(f"Loaded: {csv_path} | Rows: {len(df)} | Columns: {len(df.columns)}")
+    print("Columns:", df.columns.tolist())
 
     if not args.skip_line:
         try:
@@ -206,5 +537,7 @@ def main():
         except Exception as e:
             print(f"[correlation_heatmap] skipped: {e}")
 
+    wait_for_saves()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,14 +1,67 @@
 import subprocess
 import time
-import csv
+import fcntl
+import os
+import struct
 from datetime import datetime
 
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional: only needed for fmt="parquet"
+    pa = pq = None
+
+# VideoCore mailbox interface used by the vcgencmd binary itself
+VCIO_PATH = "/dev/vcio"
+GET_GENCMD_RESULT = 0x00030080
+MAX_STRING = 1024
+# _IOWR(100, 0, char *) -- the pointer size is part of the request number
+IOCTL_MBOX_PROPERTY = (3 << 30) | (struct.calcsize("P") << 16) | (100 << 8)
+
+# Rows per Parquet row group
+ROW_GROUP_ROWS = 1000
+
+COLUMNS = ["Timestamp", "Voltage (V)", "Current (A)", "Power (W)", "Energy So Far (Joules)"]
+
+PARQUET_SCHEMA = pa.schema(
+    [(COLUMNS[0], pa.timestamp("ms"))] + [(name, pa.float64()) for name in COLUMNS[1:]]
+) if pa is not None else None
+
+_vcio_fd = None
+
+def vcgencmd(command):
+    """
+    Runs a vcgencmd command and returns its text output.
+    Talks to /dev/vcio directly (the same mailbox call vcgencmd makes), so no
+    process is forked per sample. Falls back to the vcgencmd binary if the
+    mailbox device can't be opened.
+    """
+    global _vcio_fd
+    if _vcio_fd is None:
+        try:
+            _vcio_fd = os.open(VCIO_PATH, os.O_RDWR)
+        except OSError:
+            _vcio_fd = -1
+    if _vcio_fd < 0:
+        return subprocess.run(["vcgencmd", *command.split()], capture_output=True, text=True).stdout
+
+    # Property buffer: size, request code, tag, value buffer size, request
+    # length, error code, command string (MAX_STRING bytes), end tag
+    cmd = command.encode("ascii")[:MAX_STRING - 1]
+    buf = bytearray(6 * 4 + MAX_STRING + 4)
+    struct.pack_into("<6I", buf, 0, len(buf), 0, GET_GENCMD_RESULT, MAX_STRING, 0, 0)
+    buf[24:24 + len(cmd)] = cmd
+    fcntl.ioctl(_vcio_fd, IOCTL_MBOX_PROPERTY, buf, True)
+    return bytes(buf[24:24 + MAX_STRING]).split(b"\0", 1)[0].decode("ascii", "replace")
+
 def read_voltage_current():
     """
     Reads core voltage and current from vcgencmd pmic_read_adc output.
     Specifically looks for VDD_CORE_V and VDD_CORE_A lines.
     """
-    result = subprocess.run(["vcgencmd", "pmic_read_adc"], capture_output=True, text=True).stdout
+    result = vcgencmd("pmic_read_adc")
 
     voltage = None
     current = None
@@ -27,37 +80,90 @@ def read_voltage_current():
 
     return voltage, current
 
-def measure_energy_to_csv(duration_minutes=6, interval_seconds=0.1):
+def write_csv(filename, t, v, c, p, e):
+    """
+    Writes the whole log as CSV in one go.
+    Fixed numeric schema, so rows are preformatted bytes rather than going
+    through the csv module.
+    """
+    rows = [",".join(COLUMNS).encode() + b"\n"]
+    last_sec = None
+    for ts, vi, ci, pi, ei in zip(t.tolist(), v.tolist(), c.tolist(), p.tolist(), e.tolist()):
+        # Timestamps have one-second resolution: format once per second
+        sec = int(ts)
+        if sec != last_sec:
+            stamp = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(sec)).encode()
+            last_sec = sec
+        rows.append(b"%s,%.6f,%.6f,%.6f,%.4f\n" % (stamp, vi, ci, pi, ei))
+    with open(filename, mode='wb') as f:
+        f.write(b"".join(rows))
+
+def write_parquet(filename, t, v, c, p, e):
+    """
+    Writes the whole log as a Parquet file (ROW_GROUP_ROWS rows per group).
+    Same columns as the CSV log; timestamps are local time with ms precision.
+    """
+    utc_offset = time.localtime(int(t[0])).tm_gmtoff if len(t) else 0
+    stamps = ((t + utc_offset) * 1000).astype("int64").astype("datetime64[ms]")
+    table = pa.table(dict(zip(COLUMNS, [stamps, v, c, p, e])), schema=PARQUET_SCHEMA)
+    pq.write_table(table, filename, row_group_size=ROW_GROUP_ROWS)
+
+def measure_energy_to_csv(duration_minutes=6, interval_seconds=0.1, fmt="csv"):
+    """
+    Logs core voltage/current/power/energy for duration_minutes.
+    fmt="parquet" writes a Parquet file instead of CSV (needs pyarrow).
+    """
+    if fmt == "parquet" and pq is None:
+        raise ImportError("pyarrow is required for fmt='parquet'")
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3] 
-    filename = f"energy_log_{timestamp}.csv"
+    filename = f"energy_log_{timestamp}.{fmt}"
 
     print(f"Measuring energy for {duration_minutes} minutes...")
     print(f"Logging to {filename}")
 
-    total_energy_joules = 0.0
     start_time = time.time()
     end_time = start_time + duration_minutes * 60
 
-    with open(filename, mode='w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(["Timestamp", "Voltage (V)", "Current (A)", "Power (W)", "Energy So Far (Joules)"])
+    # The duration is fixed, so every column is preallocated for the whole run
+    # and the file is written once at the end; nothing but array stores
+    # happens in the sampling loop
+    size = int(duration_minutes * 60 / interval_seconds) + 16
+    wall = np.empty(size, dtype=np.float64)  # epoch seconds
+    dts = np.empty(size, dtype=np.float64)
+    volts = np.empty(size, dtype=np.float64)
+    amps = np.empty_like(volts)
+    watts = np.empty_like(volts)
+    n = 0
+
+    # Sample on fixed deadlines (no drift from the time spent reading) and
+    # integrate with the measured dt since the previous good sample
+    next_tick = time.perf_counter()
+    t_prev = None
 
-        while time.time() < end_time:
+    try:
+        while n < size and time.time() < end_time:
             voltage, current = read_voltage_current()
+            now = time.perf_counter()
             if voltage is not None and current is not None:
-                power = voltage * current
-                total_energy_joules += power * interval_seconds
-                writer.writerow([
-                    datetime.now().isoformat(timespec='seconds'),
-                    f"{voltage:.6f}",
-                    f"{current:.6f}",
-                    f"{power:.6f}",
-                    f"{total_energy_joules:.4f}"
-                ])
+                dts[n] = now - t_prev if t_prev is not None else 0.0
+                t_prev = now
+                wall[n] = time.time()
+                volts[n] = voltage
+                amps[n] = current
+                watts[n] = voltage * current
+                n += 1
             else:
                 print("Warning: Voltage or current not available at this moment.")
-            time.sleep(interval_seconds)
+            next_tick += interval_seconds
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+    finally:
+        energy = np.cumsum(watts[:n] * dts[:n])
+        write = write_parquet if fmt == "parquet" else write_csv
+        write(filename, wall[:n], volts[:n], amps[:n], watts[:n], energy)
 
+    total_energy_joules = float(energy[-1]) if n else 0.0
     print(f"Done! Total energy used: {total_energy_joules:.2f} J = {total_energy_joules / 3600:.6f} Wh")
 
 # Run a 5-minute measurement
@@ -4,6 +4,8 @@ import csv
 from datetime import datetime
 from math import isnan
 
+import numpy as np
+
 def read_voltage_current():
     """
     Reads core voltage and current from `vcgencmd pmic_read_adc`.
@@ -31,6 +33,31 @@ def read_voltage_current():
 
     return voltage, current
 
+def write_csv(filename, wall, volts, amps, watts, dts, energy):
+    """
+    Writes the whole log to CSV in one go. Failed readings (NaN) are written
+    as blank V/I/P fields.
+    """
+    with open(filename, mode='w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow([
+            "Timestamp (ISO ms)",
+            "Voltage (V)",
+            "Current (A)",
+            "Power (W)",
+            "dt (s)",
+            "Energy So Far (J)"
+        ])
+        rows = []
+        for t, v, c, p, dt, e in zip(wall.tolist(), volts.tolist(), amps.tolist(),
+                                     watts.tolist(), dts.tolist(), energy.tolist()):
+            stamp = datetime.fromtimestamp(t).isoformat(timespec='milliseconds')
+            if isnan(v):
+                rows.append([stamp, "", "", "", f"{dt:.6f}", f"{e:.6f}"])
+            else:
+                rows.append([stamp, f"{v:.6f}", f"{c:.6f}", f"{p:.6f}", f"{dt:.6f}", f"{e:.6f}"])
+        writer.writerows(rows)
+
 def measure_energy_to_csv(duration_minutes=6, interval_seconds=0.1):  # 10 Hz
     # Timestamp with milliseconds
     ts = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
@@ -39,61 +66,44 @@ def measure_energy_to_csv(duration_minutes=6, interval_seconds=0.1):  # 10 Hz
     print(f"Measuring energy for {duration_minutes} minutes at {1/interval_seconds:.1f} Hz...")
     print(f"Logging to {filename}")
 
-    total_energy_joules = 0.0
-
     # Use a monotonic clock for scheduling & delta times
     t_start = time.perf_counter()
     t_end   = t_start + duration_minutes * 60
     t_prev  = t_start
     next_tick = t_start  # target time for next sample
 
-    with open(filename, mode='w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow([
-            "Timestamp (ISO ms)",
-            "Voltage (V)",
-            "Current (A)",
-            "Power (W)",
-            "dt (s)",
-            "Energy So Far (J)"
-        ])
-
-        sample_idx = 0
-        while True:
+    # Preallocate every column for the whole run; the CSV is written once at
+    # the end so the loop only stores numbers
+    size = int(duration_minutes * 60 / interval_seconds) + 16
+    wall  = np.empty(size, dtype=np.float64)  # epoch seconds
+    dts   = np.empty(size, dtype=np.float64)
+    volts = np.empty(size, dtype=np.float64)
+    amps  = np.empty_like(volts)
+    watts = np.empty_like(volts)
+
+    sample_idx = 0
+    try:
+        while sample_idx < size:
             now_perf = time.perf_counter()
             if now_perf >= t_end:
                 break
 
             # Read sensor
             voltage, current = read_voltage_current()
-            timestamp_iso_ms = datetime.now().isoformat(timespec='milliseconds')
+            wall[sample_idx] = time.time()
 
             # Compute dt from last sample (first sample uses small dt=0)
-            dt = now_perf - t_prev if sample_idx > 0 else 0.0
+            dts[sample_idx] = now_perf - t_prev if sample_idx > 0 else 0.0
 
             if (voltage is not None) and (current is not None):
-                power = voltage * current  # Watts
-                # Integrate using actual dt to avoid error from jitter
-                total_energy_joules += power * dt
-                v_str = f"{voltage:.6f}"
-                c_str = f"{current:.6f}"
-                p_str = f"{power:.6f}"
+                volts[sample_idx] = voltage
+                amps[sample_idx] = current
+                watts[sample_idx] = voltage * current  # Watts
             else:
                 # If a reading failed, log blanks for V/I/P and do not add energy
-                v_str = ""
-                c_str = ""
-                p_str = ""
+                volts[sample_idx] = amps[sample_idx] = watts[sample_idx] = np.nan
                 print("Warning: Voltage or current not available at this moment.")
 
-            writer.writerow([
-                timestamp_iso_ms,
-                v_str,
-                c_str,
-                p_str,
-                f"{dt:.6f}",
-                f"{total_energy_joules:.6f}"
-            ])
-
             # Schedule next tick exactly interval_seconds ahead to minimize drift
             sample_idx += 1
             t_prev = now_perf
@@ -102,7 +112,13 @@ def measure_energy_to_csv(duration_minutes=6, interval_seconds=0.1):  # 10 Hz
             sleep_for = max(0.0, next_tick - time.perf_counter())
             if sleep_for:
                 time.sleep(sleep_for)
+    finally:
+        n = sample_idx
+        # Integrate using actual dt to avoid error from jitter
+        energy = np.cumsum(np.nan_to_num(watts[:n] * dts[:n]))
+        write_csv(filename, wall[:n], volts[:n], amps[:n], watts[:n], dts[:n], energy)
 
+    total_energy_joules = float(energy[-1]) if n else 0.0
     print(f"Done! Total energy used: {total_energy_joules:.3f} J = {total_energy_joules / 3600:.6f} Wh")
 
 # Run a 5-minute measurement at 10 Hz when executed directly
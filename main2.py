@@ -12,6 +12,24 @@ sig = rm.open_resource('USB0::0xF4EC::0xEE38::SPD3XABC123456::INSTR')  # Update
 
 # CSV output file
 output_file = 'power_log.csv'
+interval = 0.5  # 2 Hz
+
+def read_siglent_all():
+    """Voltage and current from one combined query (returns V,I[,P])."""
+    vals = sig.query('MEAS:ALL? CH1').split(',')
+    return float(vals[0]), float(vals[1])
+
+def read_siglent_separate():
+    """Voltage and current from two queries, for firmware without MEAS:ALL?."""
+    return float(sig.query('MEAS:VOLT?')), float(sig.query('MEAS:CURR?'))
+
+# Use the single round-trip query if this firmware answers it
+try:
+    read_siglent_all()
+    read_siglent = read_siglent_all
+except (pyvisa.errors.VisaIOError, ValueError, IndexError):
+    sig.clear()
+    read_siglent = read_siglent_separate
 
 # Open CSV file for writing
 with open(output_file, 'w', newline='') as csvfile:
@@ -20,6 +38,7 @@ with open(output_file, 'w', newline='') as csvfile:
     writer.writeheader()
 
     print("Starting measurement loop (2 Hz)... Press Ctrl+C to stop.")
+    next_tick = time.perf_counter()
     try:
         while True:
             timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
@@ -33,11 +52,7 @@ with open(output_file, 'w', newline='') as csvfile:
             pi_volt = float(volt_raw.replace("volt=", "").replace("V\n", ""))
 
             # Siglent SCPI measurements
-            sig.write('MEAS:VOLT?')
-            sig_volt = float(sig.read())
-
-            sig.write('MEAS:CURR?')
-            sig_curr = float(sig.read())
+            sig_volt, sig_curr = read_siglent()
 
             power = sig_volt * sig_curr
 
@@ -53,6 +68,8 @@ with open(output_file, 'w', newline='') as csvfile:
 
             print(f"[{timestamp}] Temp: {temp_c:.2f}°C | Pi Volt: {pi_volt:.3f}V | Sig Volt: {sig_volt:.2f}V | Curr: {sig_curr:.3f}A | Power: {power:.2f}W")
 
-            time.sleep(0.5)  # 2 Hz
+            # Sleep to the next 2 Hz deadline so query time doesn't stretch the interval
+            next_tick += interval
+            time.sleep(max(0.0, next_tick - time.perf_counter()))
     except KeyboardInterrupt:
         print("Measurement stopped by user.")
\ No newline at end of file